@@ -32,33 +32,48 @@ frequency dictionary to select the --maxlength most common words.
 import argparse
 import ast
 import csv
+import functools
+import heapq
 import json
 import math
+import operator
 import os
+import pickle
 import re
+import shutil
 import sys
+import time
 import urllib.request
 import urllib.error
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+# Sign ID inside a wordlist entry line, and the spot to insert gloss after video
+_LINE_VID_RE = re.compile(r'-(\d{5})-tecken\.mp4"')
+_LINE_VIDEO_FIELD_RE = re.compile(r'(video:\s*"[^"]+")(\s*\})')
 
 
 def patch_gloss_all(lists_dir, sign_rows):
-    """Add gloss field to existing wordlist JS files using sign ID from video filename."""
+    """Add gloss field to existing wordlist JS files using sign ID from video filename.
+
+    sign_rows is an iterable of (id, glosa) pairs from sign_data.csv.
+    """
     # Build sign_id (5-digit) → glosa lookup
     sign_id_to_gloss = {}
-    for row in sign_rows:
-        sid = str(row.get("id", "")).strip()
-        glosa = row.get("glosa", "").strip()
+    for sid, glosa in sign_rows:
+        sid = sid.strip()
+        glosa = glosa.strip()
         if sid and glosa:
             sign_id_to_gloss[sid] = glosa
 
-    files = sorted(f for f in os.listdir(lists_dir)
-                   if f.endswith(".js") and f != "all.js")
+    files = list_wordlist_files(lists_dir)
 
     def patch_line(line):
         """Add gloss to a word entry line (not phrase entries, not already-glossed)."""
         if 'gloss:' in line or 'phrase:' in line:
             return line
-        m = re.search(r'-(\d{5})-tecken\.mp4"', line)
+        m = _LINE_VID_RE.search(line)
         if not m:
             return line
         sign_id = m.group(1)
@@ -67,11 +82,7 @@ def patch_gloss_all(lists_dir, sign_rows):
             return line
         gloss_json = json.dumps(gloss, ensure_ascii=False)
         # Insert gloss before closing } on this line
-        return re.sub(
-            r'(video:\s*"[^"]+")(\s*\})',
-            rf'\1, gloss: {gloss_json}\2',
-            line
-        )
+        return _LINE_VIDEO_FIELD_RE.sub(rf'\1, gloss: {gloss_json}\2', line)
 
     patched_count = 0
     for fname in files:
@@ -90,39 +101,86 @@ def patch_gloss_all(lists_dir, sign_rows):
     rebuild_all_js(lists_dir)
 
 
+def list_wordlist_files(lists_dir):
+    """Sorted names of the wordlist .js files in lists_dir (all.js excluded)."""
+    with os.scandir(lists_dir) as it:
+        return sorted(e.name for e in it
+                      if e.name.endswith(".js") and e.name != "all.js" and e.is_file())
+
+
 def rebuild_all_js(lists_dir):
     """Concatenate all .js files in lists/ (except all.js) into all.js."""
-    files = sorted(f for f in os.listdir(lists_dir)
-                   if f.endswith(".js") and f != "all.js")
+    files = list_wordlist_files(lists_dir)
     all_path = os.path.join(lists_dir, "all.js")
-    with open(all_path, "w", encoding="utf-8") as out:
-        out.write("// Auto-generated — do not edit. Run: python3 gen_wordlist.py --rebuild\n")
+    # Binary copy: the lists are already UTF-8, no need to decode/re-encode
+    with open(all_path, "wb") as out:
+        out.write("// Auto-generated — do not edit. Run: python3 gen_wordlist.py --rebuild\n".encode("utf-8"))
         for f in files:
-            out.write(f"\n// --- {f} ---\n")
-            with open(os.path.join(lists_dir, f), encoding="utf-8") as inp:
-                out.write(inp.read())
+            out.write(f"\n// --- {f} ---\n".encode("utf-8"))
+            with open(os.path.join(lists_dir, f), "rb") as inp:
+                shutil.copyfileobj(inp, out, 1 << 20)
     print(f"Rebuilt lists/all.js ({len(files)} wordlists: {', '.join(files)})")
 
 
-def load_sign_data(csv_path):
-    """Load sign_data.csv → list of row dicts."""
-    rows = []
-    with open(csv_path, encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+def iter_sign_data(csv_path, columns, required=None):
+    """Stream sign_data.csv, yielding a tuple of the given columns (two or more) per row.
+
+    Columns in required (default: all of columns) must exist in the header;
+    any other missing column reads as "". Rows are read lazily and not kept,
+    so callers hold on to only what they need.
+    """
+    if required is None:
+        required = columns
+    with open(csv_path, encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        cols = {name: i for i, name in enumerate(header)}
+        missing = [c for c in required if c not in cols]
+        if missing:
+            print(f"Error: {csv_path} is missing column(s): {', '.join(missing)}", file=sys.stderr)
+            sys.exit(1)
+        # Missing columns point at an "" appended to each row
+        get = operator.itemgetter(*(cols.get(c, len(header)) for c in columns))
         for row in reader:
-            rows.append(row)
-    return rows
+            row.append("")
+            yield get(row)
 
 
 def load_frequency(freq_path):
-    """Load stats_PAROLE.txt → dict of word → rank (lower = more common)."""
+    """Load stats_PAROLE.txt → dict of word → rank (lower = more common).
+
+    The parsed dict is cached as {freq_path}.pkl and reused while it is
+    newer than the text file.
+    """
+    cache_path = freq_path + ".pkl"
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(freq_path):
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        # Missing, truncated or written by a newer Python — re-parse
+        pass
+    freq = _parse_frequency(freq_path)
+    try:
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(freq, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return freq
+
+
+def _parse_frequency(freq_path):
+    """Parse stats_PAROLE.txt (tab-separated, one word form per line)."""
     freq = {}
     rank = 0
     with open(freq_path, encoding="utf-8") as f:
         for line in f:
-            parts = line.split("\t")
-            if len(parts) >= 5:
-                word = parts[0].strip().lower()
+            # Only the first column is used; skip lines without a tab
+            word, tab, _ = line.partition("\t")
+            if tab:
+                word = word.strip().lower()
                 if word and word not in freq:
                     freq[word] = rank
                     rank += 1
@@ -132,9 +190,8 @@ def load_frequency(freq_path):
 BOK_SLUG = "bokstavering"
 
 
-def is_bokstavering_row(row):
-    """Return True if row is pure fingerspelling (no combined sign)."""
-    desc = row.get("description", "")
+def is_bokstavering(desc):
+    """Return True if a sign description is pure fingerspelling (no combined sign)."""
     return desc.startswith("Bokstaveras:") and "//" not in desc
 
 
@@ -143,9 +200,14 @@ def extract_video_filename(movie_path):
     return movie_path.rsplit("/", 1)[-1] if "/" in movie_path else movie_path
 
 
+VERIFY_WORKERS = 32
+VIDEO_CACHE_TTL = 30 * 24 * 3600  # seconds a verified video is trusted without re-checking
+_VID_RE = re.compile(r"-(\d{5})-tecken\.mp4$")
+
+
 def check_video_url(filename):
     """Check if the video exists on su.se via HTTP HEAD request."""
-    match = re.search(r"-(\d{5})-tecken\.mp4$", filename)
+    match = _VID_RE.search(filename)
     if not match:
         return False
     prefix = match.group(1)[:2]
@@ -158,6 +220,62 @@ def check_video_url(filename):
         return False
 
 
+def check_video_urls(filenames, cache=None):
+    """Check many video filenames concurrently.
+
+    Returns (list of bools in input order, set of filenames served from cache).
+    cache maps filename → unix time the video was last found. Entries younger
+    than VIDEO_CACHE_TTL skip the request; videos found now are added. Only
+    hits are cached, so a missing video (or a network error) is retried next run.
+    """
+    if cache is None:
+        cache = {}
+    now = int(time.time())
+    cached = {f for f in filenames if now - cache.get(f, 0) < VIDEO_CACHE_TTL}
+    todo = list(dict.fromkeys(f for f in filenames if f not in cached))
+    found = {}
+    with ThreadPoolExecutor(max_workers=VERIFY_WORKERS) as ex:
+        futures = {ex.submit(check_video_url, f): f for f in todo}
+        for n, fut in enumerate(as_completed(futures), 1):
+            found[futures[fut]] = fut.result()
+            print(f"\r  {n}/{len(todo)} checked", end="", flush=True)
+    if todo:
+        print()
+    for filename, ok in found.items():
+        if ok:
+            cache[filename] = now
+        else:
+            cache.pop(filename, None)
+    return [f in cached or found[f] for f in filenames], cached
+
+
+def load_video_cache(cache_path):
+    """Load the verified-video cache (filename → unix time), or {} if unreadable.
+
+    Entries whose value is not a timestamp are dropped, so they get re-checked.
+    """
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    return {name: ts for name, ts in cache.items()
+            if isinstance(ts, (int, float)) and not isinstance(ts, bool)}
+
+
+def save_video_cache(cache_path, cache):
+    """Write the verified-video cache, ignoring write failures."""
+    try:
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, ensure_ascii=False, indent=0, sort_keys=True)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
 def parse_phrases_column(phrases_str):
     """Parse the 'phrases' column from sign_data.csv.
 
@@ -166,63 +284,145 @@ def parse_phrases_column(phrases_str):
     """
     if not phrases_str or not phrases_str.strip():
         return []
+    phrases_str = phrases_str.strip()
+    # Fast path: with ' swapped for " most rows are valid JSON. Rows where that
+    # breaks (apostrophes or quotes inside a phrase) fall back to literal_eval.
     try:
-        result = ast.literal_eval(phrases_str.strip())
-        if isinstance(result, list):
-            return result
-        return []
-    except (ValueError, SyntaxError):
-        return []
+        result = json.loads(phrases_str.replace("'", '"'))
+    except ValueError:
+        try:
+            result = ast.literal_eval(phrases_str)
+        except (ValueError, SyntaxError):
+            return []
+    if isinstance(result, list):
+        return result
+    return []
+
+
+# Phrase cleanup: "alt N." prefix and runs of whitespace
+_ALT_RE = re.compile(r"^alt\s+\d+\.\s*")
+_WS_RE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=4096)
+def _bracket_pattern(word):
+    """Compiled auto_bracket pattern for word (a word usually has several phrases).
+
+    Stays on stdlib re: the lookarounds are not supported by RE2.
+    """
+    return re.compile(rf"(?<!\[)(?<!\w)({re.escape(word)}\w*)(?!\])", re.IGNORECASE)
 
 
 def auto_bracket(word, phrase_text):
     """Regex-bracket stem-sharing forms of word in phrase_text."""
-    return re.sub(
-        rf"(?<!\[)(?<!\w)({re.escape(word)}\w*)(?!\])",
-        r"[\1]",
-        phrase_text,
-        flags=re.IGNORECASE,
-    )
+    return _bracket_pattern(word).sub(r"[\1]", phrase_text)
+
+
+_BRACKETED_RE = re.compile(r"\[[^\]]*\]")
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def needs_ai_bracket(word, bracketed):
+    """Heuristic: True if auto_bracket's result looks incomplete.
+
+    That is when nothing was bracketed, or when an unbracketed token shares the
+    word's stem (e.g. "ville" for "vilja", "fåglar" for "fågel") — an irregular
+    form the prefix regex missed.
+    """
+    if "[" not in bracketed:
+        return True
+    stem = word[:max(3, len(word) - 2)].lower()
+    rest = _BRACKETED_RE.sub(" ", bracketed)
+    return any(tok.lower().startswith(stem) for tok in _TOKEN_RE.findall(rest))
+
+
+AI_BATCH_SIZE = 20
+AI_WORKERS = 4
+_NUMBERED_RE = re.compile(r"^(\d+)\.\s*(.*)$")
+
 
+def ai_bracket_batch(items, client):
+    """Use one Claude Haiku request to bracket inflected/derived forms in a batch.
 
-def ai_bracket(word, phrase_text, client):
-    """Use Claude Haiku to bracket inflected/derived forms of word in phrase_text."""
+    items is a list of (word, phrase_text). Returns bracketed phrases in input
+    order, with None for any phrase missing from the reply or whose reply is
+    not the input phrase with only brackets added.
+    """
+    numbered = "\n".join(f'{n}. base word: "{word}" | phrase: "{phrase_text}"'
+                         for n, (word, phrase_text) in enumerate(items, 1))
     prompt = (
-        f'Swedish base word: "{word}"\n'
-        f'Phrase: "{phrase_text}"\n'
-        f'Wrap ALL occurrences of this word and its inflected or derived forms '
-        f'(including compounds) in [square brackets]. Return ONLY the phrase.'
+        'For each numbered Swedish phrase below, wrap ALL occurrences of its base word '
+        'and its inflected or derived forms (including compounds) in [square brackets]. '
+        'Return ONLY the bracketed phrases, one per line, with the same numbering ("N. phrase"). '
+        'Do not repeat the "base word:" or "phrase:" labels, the quotes, or any other text.\n\n'
+        + numbered
     )
     message = client.messages.create(
         model="claude-haiku-4-5-20251001",
-        max_tokens=256,
+        max_tokens=128 * len(items),
         messages=[{"role": "user", "content": prompt}],
     )
-    return message.content[0].text.strip().strip('"')
+    replies = {}
+    for line in message.content[0].text.splitlines():
+        m = _NUMBERED_RE.match(line.strip())
+        if m:
+            replies[int(m.group(1))] = m.group(2).strip()
+    results = []
+    for n, (_, phrase_text) in enumerate(items, 1):
+        reply = replies.get(n, "")
+        # Accept only the input phrase with brackets added — rejects echoed
+        # labels, chatter and misnumbered lines
+        for candidate in (reply, reply.strip('"')):
+            if candidate and candidate.replace("[", "").replace("]", "") == phrase_text:
+                results.append(candidate)
+                break
+        else:
+            results.append(None)
+    return results
+
+
+def ai_bracket_all(items, client):
+    """Bracket (word, phrase_text) pairs in batches of AI_BATCH_SIZE, AI_WORKERS requests at a time.
+
+    Returns one result per item, None where the model's reply had no line for it.
+    """
+    batches = [items[i:i + AI_BATCH_SIZE] for i in range(0, len(items), AI_BATCH_SIZE)]
+    with ThreadPoolExecutor(max_workers=AI_WORKERS) as ex:
+        results = ex.map(lambda batch: ai_bracket_batch(batch, client), batches)
+        return [phrase for batch in results for phrase in batch]
 
 
 def write_wordlist_js(output_path, wl_id, wl_name, entries, phrase_entries):
     """Write a single wordlist JS file."""
     os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    jd = functools.partial(json.dumps, ensure_ascii=False)
+
+    def block(lines):
+        """One entry per line, comma-separated, newline after the last."""
+        return ",\n".join(lines) + "\n" if lines else ""
+
+    words = block([
+        f'    {{ word: {jd(e["word"])}, video: {jd(e["video"])}'
+        f'{", gloss: " + jd(e["gloss"]) if e.get("gloss") else ""} }}'
+        for e in entries
+    ])
+    parts = [
+        '(window.WORDLISTS = window.WORDLISTS || []).push({\n',
+        f'  id: {jd(wl_id)},\n',
+        f'  name: {jd(wl_name)},\n',
+        '  words: [\n', words, '  ]',
+    ]
+    if phrase_entries:
+        phrases = block([
+            f'    {{ word: {jd(pe["word"])}, phrase: {jd(pe["phrase"])}, video: {jd(pe["video"])} }}'
+            for pe in phrase_entries
+        ])
+        parts += [',\n  phrases: [\n', phrases, '  ]\n']
+    else:
+        parts.append('\n')
+    parts.append('});\n')
     with open(output_path, "w", encoding="utf-8") as f:
-        f.write('(window.WORDLISTS = window.WORDLISTS || []).push({\n')
-        f.write(f'  id: {json.dumps(wl_id, ensure_ascii=False)},\n')
-        f.write(f'  name: {json.dumps(wl_name, ensure_ascii=False)},\n')
-        f.write('  words: [\n')
-        for i, entry in enumerate(entries):
-            comma = "," if i < len(entries) - 1 else ""
-            gloss_part = ', gloss: ' + json.dumps(entry["gloss"], ensure_ascii=False) if entry.get("gloss") else ""
-            f.write(f'    {{ word: {json.dumps(entry["word"], ensure_ascii=False)}, video: {json.dumps(entry["video"], ensure_ascii=False)}{gloss_part} }}{comma}\n')
-        f.write('  ]')
-        if phrase_entries:
-            f.write(',\n  phrases: [\n')
-            for i, pe in enumerate(phrase_entries):
-                comma = "," if i < len(phrase_entries) - 1 else ""
-                f.write(f'    {{ word: {json.dumps(pe["word"], ensure_ascii=False)}, phrase: {json.dumps(pe["phrase"], ensure_ascii=False)}, video: {json.dumps(pe["video"], ensure_ascii=False)} }}{comma}\n')
-            f.write('  ]\n')
-        else:
-            f.write('\n')
-        f.write('});\n')
+        f.write("".join(parts))
 
 
 def main():
@@ -250,7 +450,7 @@ def main():
     parser.add_argument("--list-categories", action="store_true", help="List all categories and exit")
     parser.add_argument("--rebuild", action="store_true", help="Rebuild lists/all.js and exit")
     parser.add_argument("--phrases", action="store_true", help="Embed phrase data in output JS")
-    parser.add_argument("--ai-bracket", action="store_true", help="Use Claude Haiku to bracket inflection forms (requires: pip install anthropic + ANTHROPIC_API_KEY)")
+    parser.add_argument("--ai-bracket", action="store_true", help="Use Claude Haiku to bracket inflection forms in phrases the regex leaves unbracketed (requires: pip install anthropic + ANTHROPIC_API_KEY)")
     parser.add_argument("--split", type=int, default=None, help="Split into balanced chunks of at most N words; generates {id}1.js, {id}2.js, ...")
     parser.add_argument("--patch-gloss", action="store_true", help="Add gloss field to all existing wordlist JS files and rebuild all.js")
     args = parser.parse_args()
@@ -270,7 +470,7 @@ def main():
             print(f"Error: CSV file not found: {csv_path}", file=sys.stderr)
             sys.exit(1)
         print(f"Loading sign data: {csv_path}")
-        sign_rows = load_sign_data(csv_path)
+        sign_rows = list(iter_sign_data(csv_path, ("id", "glosa")))
         print(f"Loaded {len(sign_rows)} entries")
         patch_gloss_all(lists_dir, sign_rows)
         return
@@ -279,21 +479,15 @@ def main():
         print(f"Error: CSV file not found: {csv_path}", file=sys.stderr)
         sys.exit(1)
 
-    print(f"Loading sign data: {csv_path}")
-    sign_rows = load_sign_data(csv_path)
-    print(f"Loaded {len(sign_rows)} entries from sign_data.csv")
-
     # --- List categories mode ---
     if args.list_categories:
-        cats = {}
-        for row in sign_rows:
-            slug = row.get("category_slug", "").strip()
-            label = row.get("category", "").strip()
-            if slug:
-                cats[slug] = (label, cats.get(slug, (label, 0))[1] + 1)
-        for slug in sorted(cats.keys()):
-            label, count = cats[slug]
-            print(f"  {slug}  ({label}, {count} words)")
+        print(f"Loading sign data: {csv_path}")
+        sign_rows = list(iter_sign_data(csv_path, ("category_slug", "category"), required=("category_slug",)))
+        print(f"Loaded {len(sign_rows)} entries from sign_data.csv")
+        counts = Counter(filter(None, (slug.strip() for slug, _ in sign_rows)))
+        labels = {slug.strip(): label.strip() for slug, label in sign_rows}
+        for slug in sorted(counts):
+            print(f"  {slug}  ({labels[slug]}, {counts[slug]} words)")
         return
 
     # Validate required args for generation
@@ -323,29 +517,34 @@ def main():
     has_bok = BOK_SLUG in category_slugs
     other_slugs = category_slugs - {BOK_SLUG}
 
-    # Build word → sign data lookup (word → first matching row)
+    # Stream sign_data.csv once, building word → sign data lookup (word → first
+    # matching row) and collecting which of the requested slugs occur
+    print(f"Loading sign data: {csv_path}")
     word_lookup = {}
-    for row in sign_rows:
-        word = row["word"].strip().lower()
-        slug = row.get("category_slug", "").strip().lower()
-        movie = row.get("movie", "").strip()
-        if not movie:
-            continue
+    matched_slugs = set()
+    num_rows = 0
+    sign_rows = iter_sign_data(csv_path, ("word", "category_slug", "description", "movie", "glosa", "phrases"),
+                               required=("word", "movie", "phrases") if args.phrases else ("word", "movie"))
+    for num_rows, (word, slug, desc, movie, gloss, phrases) in enumerate(sign_rows, 1):
+        movie = movie.strip()
         if category_slugs:
-            matches = (has_bok and is_bokstavering_row(row)) or (bool(other_slugs) and slug in other_slugs)
-            if not matches:
+            slug = slug.strip().lower()
+            in_other = slug in other_slugs
+            if in_other:
+                matched_slugs.add(slug)
+            is_bok = has_bok and is_bokstavering(desc)
+            if not movie or not (is_bok or in_other):
                 continue
+            if is_bok:
+                matched_slugs.add(BOK_SLUG)
+        elif not movie:
+            continue
+        word = word.strip().lower()
         if word not in word_lookup:
-            word_lookup[word] = row
+            word_lookup[word] = {"movie": movie, "gloss": gloss.strip(), "phrases": phrases}
+    print(f"Loaded {num_rows} entries from sign_data.csv")
 
     if category_slugs:
-        matched_slugs = set()
-        for row in sign_rows:
-            slug = row.get("category_slug", "").strip().lower()
-            if slug and slug in other_slugs:
-                matched_slugs.add(slug)
-            if has_bok and is_bokstavering_row(row) and row.get("movie", "").strip():
-                matched_slugs.add(BOK_SLUG)
         missing = category_slugs - matched_slugs
         if matched_slugs:
             print(f"Category slug(s) matched: {', '.join(sorted(matched_slugs))} ({len(word_lookup)} words)")
@@ -355,7 +554,7 @@ def main():
     # If wordfile provided, use it as the candidate list
     if args.wordfile:
         with open(args.wordfile, encoding="utf-8") as f:
-            input_words = [line.strip().lower() for line in f if line.strip()]
+            input_words = [w for w in (line.strip().lower() for line in f) if w]
         candidates = []
         warnings = []
         for w in input_words:
@@ -380,14 +579,17 @@ def main():
         print(f"Loaded {len(freq)} unique word forms")
 
     max_rank = len(freq)
-    candidates.sort(key=lambda w: freq.get(w, max_rank))
 
-    # Trim to maxlength
+    def rank(w):
+        return freq.get(w, max_rank)
+
+    # Trim to maxlength; nsmallest is stable like sort but only keeps the top K
     if len(candidates) > args.maxlength:
-        dropped = candidates[args.maxlength:]
-        candidates = candidates[:args.maxlength]
-        print(f"Trimmed to {args.maxlength} most frequent words (dropped {len(dropped)})")
+        num_dropped = len(candidates) - args.maxlength
+        candidates = heapq.nsmallest(args.maxlength, candidates, key=rank)
+        print(f"Trimmed to {args.maxlength} most frequent words (dropped {num_dropped})")
     else:
+        candidates.sort(key=rank)
         print(f"Selected {len(candidates)} words")
 
     # --- Build entries with video verification ---
@@ -395,60 +597,76 @@ def main():
     entries = []
     warnings = []
 
-    for word in candidates:
-        row = word_lookup[word]
-        filename = extract_video_filename(row["movie"])
+    filenames = [extract_video_filename(word_lookup[word]["movie"]) for word in candidates]
+    if not args.no_verify:
+        video_cache_path = os.path.join(script_dir, ".video_cache.json")
+        video_cache = load_video_cache(video_cache_path)
+        print(f"Checking {len(filenames)} videos ({VERIFY_WORKERS} parallel requests, cache: {video_cache_path})...")
+        found, cached = check_video_urls(filenames, video_cache)
+        save_video_cache(video_cache_path, video_cache)
+    else:
+        found, cached = [True] * len(filenames), set()
 
-        gloss = row.get("glosa", "").strip()
+    for word, filename, ok in zip(candidates, filenames, found):
+        gloss = word_lookup[word]["gloss"]
         if not args.no_verify:
-            print(f"  Checking: {word} -> {filename} ...", end=" ", flush=True)
-            if check_video_url(filename):
-                print("OK")
-                entries.append({"word": word, "video": filename, "gloss": gloss})
-            else:
-                print("MISSING")
-                warnings.append(f"VIDEO MISSING: '{word}' -> {filename}")
-        else:
+            status = "OK (cached)" if filename in cached else "OK" if ok else "MISSING"
+            print(f"  Checking: {word} -> {filename} ... {status}")
+        if ok:
             entries.append({"word": word, "video": filename, "gloss": gloss})
+        else:
+            warnings.append(f"VIDEO MISSING: '{word}' -> {filename}")
 
     # --- Build phrase entries ---
 
     phrase_entries = []
     if args.phrases:
+        ai_pending = []  # (index into phrase_entries, word, unbracketed text)
+        seen_phrases = set()
         for entry in entries:
             word = entry["word"]
-            row = word_lookup[word]
-            raw_phrases = parse_phrases_column(row.get("phrases", ""))
+            raw_phrases = parse_phrases_column(word_lookup[word]["phrases"])
             for p in raw_phrases:
                 phrase_text = p.get("phrase", "").strip()
                 movie = p.get("movie", "").strip()
                 if not phrase_text or not movie:
                     continue
                 # Strip "alt N." prefix
-                phrase_text = re.sub(r"^alt\s+\d+\.\s*", "", phrase_text)
+                phrase_text = _ALT_RE.sub("", phrase_text)
                 # Collapse whitespace
-                phrase_text = re.sub(r"\s+", " ", phrase_text).strip()
+                phrase_text = _WS_RE.sub(" ", phrase_text).strip()
                 if not phrase_text:
                     continue
-                # Apply bracketing
-                if ai_client:
-                    print(f"  AI-bracket: '{word}' in '{phrase_text[:50]}...'", end=" ", flush=True)
-                    phrase_text = ai_bracket(word, phrase_text, ai_client)
-                    print("done")
-                else:
-                    phrase_text = auto_bracket(word, phrase_text)
-                video_filename = extract_video_filename(movie)
-                phrase_entries.append({"word": word, "phrase": phrase_text, "video": video_filename})
-
-        # Deduplicate by (word, phrase_text) — same text with different videos counts once
-        seen_phrases = set()
-        unique_phrase_entries = []
-        for pe in phrase_entries:
-            key = (pe["word"], pe["phrase"])
-            if key not in seen_phrases:
+                # Deduplicate by (word, phrase_text) — same text with different videos counts once
+                key = (word, phrase_text)
+                if key in seen_phrases:
+                    continue
                 seen_phrases.add(key)
-                unique_phrase_entries.append(pe)
-        phrase_entries = unique_phrase_entries
+                # Apply bracketing; escalate to the AI only when the regex looks off
+                bracketed = auto_bracket(word, phrase_text)
+                if ai_client and needs_ai_bracket(word, bracketed):
+                    ai_pending.append((len(phrase_entries), word, phrase_text))
+                video_filename = extract_video_filename(movie)
+                phrase_entries.append({"word": word, "phrase": bracketed, "video": video_filename})
+
+        if ai_client:
+            num_requests = math.ceil(len(ai_pending) / AI_BATCH_SIZE)
+            num_missing = 0
+            if ai_pending:
+                print(f"  AI-bracket: {len(ai_pending)} phrases in {num_requests} requests ...", end=" ", flush=True)
+                results = ai_bracket_all([(word, text) for _, word, text in ai_pending], ai_client)
+                for (i, _, _), phrase_text in zip(ai_pending, results):
+                    # Missing or rejected reply: keep the auto_bracket result
+                    if phrase_text is None:
+                        num_missing += 1
+                    else:
+                        phrase_entries[i]["phrase"] = phrase_text
+                print("done")
+            print(f"AI-bracket: bracketed {len(ai_pending) - num_missing}/{len(phrase_entries)} phrases "
+                  f"({num_requests} API requests), regex bracketing kept for the rest")
+            if num_missing:
+                print(f"Warning: {num_missing} phrases sent to the AI were missing or altered in its reply "
+                      "and kept regex bracketing")
 
     # --- Output JS file(s) ---
 